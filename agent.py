@@ -4,12 +4,26 @@ from agno.tools.reasoning import ReasoningTools
 from config import OPENAI_API_KEY
 
 
+# All four agents talk to the same model, so they share one OpenAIChat
+# instance: its underlying HTTP client keeps pooled connections to the API
+# alive across calls instead of each agent opening (and TLS-handshaking)
+# its own.
+_shared_model = None
+
+
+def _get_model() -> OpenAIChat:
+    global _shared_model
+    if _shared_model is None:
+        _shared_model = OpenAIChat(id="gpt-4o", api_key=OPENAI_API_KEY)
+    return _shared_model
+
+
 def create_data_analyst_agent():
     """Data Analyst that shares findings with team"""
     return Agent(
         name="DataAnalyst",
         role="Senior Financial Data Analyst",
-        model=OpenAIChat(id="gpt-4o", api_key=OPENAI_API_KEY),
+        model=_get_model(),
         instructions=[
             "You are a senior financial data analyst in a collaborative team.",
             "",
@@ -51,7 +65,7 @@ def create_risk_evaluator_agent():
     return Agent(
         name="RiskEvaluator",
         role="Chief Risk Officer",
-        model=OpenAIChat(id="gpt-4o", api_key=OPENAI_API_KEY),
+        model=_get_model(),
         instructions=[
             "You are a chief risk officer in a collaborative financial analysis team.",
             "",
@@ -101,7 +115,7 @@ def create_strategy_advisor_agent():
     return Agent(
         name="StrategyAdvisor",
         role="Chief Strategy Officer",
-        model=OpenAIChat(id="gpt-4o", api_key=OPENAI_API_KEY),
+        model=_get_model(),
         instructions=[
             "You are a chief strategy officer synthesizing team insights into action plans.",
             "",
@@ -155,7 +169,7 @@ def create_report_compiler_agent():
     return Agent(
         name="ReportCompiler",
         role="Financial Analysis Team Lead & Report Writer",
-        model=OpenAIChat(id="gpt-4o", api_key=OPENAI_API_KEY),
+        model=_get_model(),
         instructions=[
             "You are the team lead facilitating collaborative financial analysis.",
             "",
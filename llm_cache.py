@@ -0,0 +1,111 @@
+"""
+llm_cache.py
+==========
+On-disk response cache for agent prompts.
+
+The pipeline's prompts embed deterministic dataframe shapes, columns and
+statistics, so re-running the analysis on unchanged data would otherwise pay
+full OpenAI latency and token cost for identical requests. This module stores
+prompt/response pairs in a local SQLite database keyed on a SHA-256 hash of
+the whitespace-normalized prompt, collapsing repeat runs from seconds per
+call to a single database lookup.
+
+Configuration (environment variables):
+    - LLM_CACHE      : set to "0" to disable caching entirely.
+    - LLM_CACHE_PATH : cache file location (default: .llm_cache.sqlite3).
+
+Usage:
+    from llm_cache import get_cached_response, store_response
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+from collections import OrderedDict
+
+# ----------------------------------------------------------------------
+# Configuration
+# ----------------------------------------------------------------------
+CACHE_ENABLED = os.getenv("LLM_CACHE", "1") != "0"
+CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache.sqlite3")
+
+_WHITESPACE = re.compile(r"\s+")
+
+# In-process LRU layer in front of SQLite: repeat prompts within one run
+# (e.g. a retried phase) resolve without touching the database
+_MEMORY_CACHE_SIZE = 128
+_memory_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _memory_get(key: str) -> str | None:
+    response = _memory_cache.get(key)
+    if response is not None:
+        _memory_cache.move_to_end(key)
+    return response
+
+
+def _memory_put(key: str, response: str) -> None:
+    _memory_cache[key] = response
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _prompt_key(prompt: str) -> str:
+    """Hash a prompt after collapsing whitespace, so reformatted but
+    otherwise identical prompts hit the same cache row."""
+    normalized = _WHITESPACE.sub(" ", prompt).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "  key TEXT PRIMARY KEY,"
+        "  prompt TEXT NOT NULL,"
+        "  response TEXT NOT NULL,"
+        "  created_at TEXT DEFAULT CURRENT_TIMESTAMP"
+        ")"
+    )
+    return conn
+
+
+def get_cached_response(prompt: str) -> str | None:
+    """Return the cached response for this prompt, or None on a miss."""
+    if not CACHE_ENABLED:
+        return None
+    key = _prompt_key(prompt)
+    cached = _memory_get(key)
+    if cached is not None:
+        return cached
+    try:
+        with _connect() as conn:
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+    except sqlite3.Error:
+        # A broken cache must never break the pipeline
+        return None
+    if row:
+        _memory_put(key, row[0])
+        return row[0]
+    return None
+
+
+def store_response(prompt: str, response: str) -> None:
+    """Persist a prompt/response pair for future runs."""
+    if not CACHE_ENABLED:
+        return
+    key = _prompt_key(prompt)
+    _memory_put(key, response)
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, prompt, response) VALUES (?, ?, ?)",
+                (key, prompt, response),
+            )
+    except sqlite3.Error:
+        pass
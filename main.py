@@ -3,6 +3,7 @@ main.py - TRUE COLLABORATIVE MULTI-AGENT SYSTEM
 Agents communicate with each other, share insights, and build on each other's work
 """
 
+import asyncio
 import os
 import pandas as pd
 from fpdf import FPDF
@@ -12,7 +13,8 @@ import re
 from typing import List, Optional, Tuple
 from config import OPENAI_API_KEY
 from datetime import datetime
-from helper import read_file_to_df
+from helper import read_file_to_df, read_files_to_dfs, fast_describe
+from llm_cache import get_cached_response, store_response
 from agent import (
     create_data_analyst_agent,
     create_risk_evaluator_agent,
@@ -27,14 +29,12 @@ class BeautifulFinancialPDF(FPDF):
     def __init__(self):
         super().__init__()
         self.set_auto_page_break(auto=True, margin=15)
-        self.base_font = "LiberationSans" if getattr(self, "custom_font", False) else "Arial"
 
-        
         # Try to load custom fonts
         try:
             font_regular = "liberation-fonts-ttf-2.1.5/LiberationSans-Regular.ttf"
             font_bold = "liberation-fonts-ttf-2.1.5/LiberationSerif-Bold.ttf"
-            
+
             if os.path.exists(font_regular) and os.path.exists(font_bold):
                 self.add_font("LiberationSans", "", font_regular, uni=True)
                 self.add_font("LiberationSans", "B", font_bold, uni=True)
@@ -43,8 +43,15 @@ class BeautifulFinancialPDF(FPDF):
                 self.custom_font = False
         except:
             self.custom_font = False
-        
+
+        # Resolve the family once after registration; every set_base_font
+        # call reuses it instead of re-checking custom_font
+        self.base_font = "LiberationSans" if self.custom_font else "Arial"
         self.chapter_num = 0
+
+    def set_base_font(self, style: str = "", size: int = 10):
+        """Select the report font in the given style and size"""
+        self.set_font(self.base_font, style, size)
     
     def header(self):
         """Custom header with branding"""
@@ -57,10 +64,7 @@ class BeautifulFinancialPDF(FPDF):
         self.rect(0, 0, 210, 20, 'F')
         
         # Header text
-        if self.custom_font:
-            self.set_font("LiberationSans", "", 9)
-        else:
-            self.set_font("Arial", "", 9)
+        self.set_base_font("", 9)
         
         self.set_text_color(100, 100, 100)
         self.set_xy(10, 8)
@@ -83,10 +87,7 @@ class BeautifulFinancialPDF(FPDF):
         self.set_fill_color(240, 240, 240)
         self.rect(0, self.get_y(), 210, 15, 'F')
         
-        if self.custom_font:
-            self.set_font("LiberationSans", "", 8)
-        else:
-            self.set_font("Arial", "", 8)
+        self.set_base_font("", 8)
         
         self.set_text_color(100, 100, 100)
         self.cell(0, 10, f"Generated by Agno Multi-Agent Framework | {datetime.now().strftime('%B %d, %Y')}", 0, 0, 'C')
@@ -110,20 +111,14 @@ class BeautifulFinancialPDF(FPDF):
         
         # Main title
         self.set_y(90)
-        if self.custom_font:
-            self.set_font("LiberationSans", "B", 24)
-        else:
-            self.set_font("Arial", "B", 24)
+        self.set_base_font("B", 24)
         
         self.set_text_color(41, 98, 255)
         self.multi_cell(0, 12, title, 0, 'C')
         
         # Subtitle
         self.ln(5)
-        if self.custom_font:
-            self.set_font("LiberationSans", "", 14)
-        else:
-            self.set_font("Arial", "", 14)
+        self.set_base_font("", 14)
         
         self.set_text_color(100, 100, 100)
         self.multi_cell(0, 8, subtitle, 0, 'C')
@@ -134,10 +129,7 @@ class BeautifulFinancialPDF(FPDF):
         self.rect(30, 180, 150, 60, 'F')
         
         self.set_y(190)
-        if self.custom_font:
-            self.set_font("LiberationSans", "", 11)
-        else:
-            self.set_font("Arial", "", 11)
+        self.set_base_font("", 11)
         
         self.set_text_color(60, 60, 60)
         info_text = f"""
@@ -161,10 +153,7 @@ class BeautifulFinancialPDF(FPDF):
         self.rect(10, self.get_y(), 5, 10, 'F')
         
         # Chapter number and title
-        if self.custom_font:
-            self.set_font("LiberationSans", "B", 16)
-        else:
-            self.set_font("Arial", "B", 16)
+        self.set_base_font("B", 16)
         
         self.set_text_color(*color)
         self.set_x(18)
@@ -183,16 +172,10 @@ class BeautifulFinancialPDF(FPDF):
         self.ln(5)
         
         if level == 2:
-            if self.custom_font:
-                self.set_font("LiberationSans", "B", 13)
-            else:
-                self.set_font("Arial", "B", 13)
+            self.set_base_font("B", 13)
             self.set_text_color(52, 73, 94)
         else:
-            if self.custom_font:
-                self.set_font("LiberationSans", "B", 11)
-            else:
-                self.set_font("Arial", "B", 11)
+            self.set_base_font("B", 11)
             self.set_text_color(127, 140, 141)
         
         self.multi_cell(0, 7, text, 0, 'L')
@@ -200,10 +183,7 @@ class BeautifulFinancialPDF(FPDF):
         self.set_text_color(0, 0, 0)
     
     def body_text(self, text: str):
-        if self.custom_font:
-            self.set_font("LiberationSans", "", 10)
-        else:
-            self.set_font("Arial", "", 10)
+        self.set_base_font("", 10)
         self.set_text_color(50, 50, 50)
 
         # ensure we have enough horizontal space
@@ -222,10 +202,7 @@ class BeautifulFinancialPDF(FPDF):
     
     def bullet_point(self, text: str, indent=15):
         """Styled bullet point"""
-        if self.custom_font:
-            self.set_font("LiberationSans", "", 10)
-        else:
-            self.set_font("Arial", "", 10)
+        self.set_base_font("", 10)
         
         self.set_x(10 + indent)
         self.set_text_color(41, 98, 255)
@@ -259,19 +236,13 @@ class BeautifulFinancialPDF(FPDF):
         
         # Label
         self.set_xy(current_x + 5, current_y + 5)
-        if self.custom_font:
-            self.set_font("LiberationSans", "", 9)
-        else:
-            self.set_font("Arial", "", 9)
+        self.set_base_font("", 9)
         self.set_text_color(255, 255, 255)
         self.cell(box_width - 10, 5, label, 0, 0, 'L')
         
         # Value
         self.set_xy(current_x + 5, current_y + 12)
-        if self.custom_font:
-            self.set_font("LiberationSans", "B", 14)
-        else:
-            self.set_font("Arial", "B", 14)
+        self.set_base_font("B", 14)
         self.cell(box_width - 10, 8, value, 0, 0, 'L')
         
         self.set_text_color(0, 0, 0)
@@ -313,19 +284,13 @@ class BeautifulFinancialPDF(FPDF):
         
         # Title text
         self.set_xy(x_start + 3, y_start + 2)
-        if self.custom_font:
-            self.set_font("LiberationSans", "B", 10)
-        else:
-            self.set_font("Arial", "B", 10)
+        self.set_base_font("B", 10)
         self.set_text_color(255, 255, 255)
         self.cell(0, 4, title, 0, 1)
         
         # Content
         self.set_xy(x_start + 3, y_start + 10)
-        if self.custom_font:
-            self.set_font("LiberationSans", "", 9)
-        else:
-            self.set_font("Arial", "", 9)
+        self.set_base_font("", 9)
         self.set_text_color(60, 60, 60)
         
         # Calculate content height
@@ -360,10 +325,7 @@ class BeautifulFinancialPDF(FPDF):
             self.circle(self.get_x() + 3, self.get_y() + 3, 3, 'F')
             
             self.set_xy(20, self.get_y())
-            if self.custom_font:
-                self.set_font("LiberationSans", "", 10)
-            else:
-                self.set_font("Arial", "", 10)
+            self.set_base_font("", 10)
             
             self.set_text_color(255, 255, 255)
             self.set_xy(self.get_x() - 2.5, self.get_y() + 0.5)
@@ -381,9 +343,15 @@ class BeautifulFinancialPDF(FPDF):
         self.ellipse(x - r, y - r, r * 2, r * 2, style)
 
 
-def generate_beautiful_pdf_report(analysis_content: str, data_context: str, output_path: str, dataframe: Optional[pd.DataFrame] = None, files_count: int = 0) -> str:
+def generate_beautiful_pdf_report(analysis_content: str, data_context: str, output_path: str, dataframe: Optional[pd.DataFrame] = None, files_count: int = 0, sections: Optional[List[Tuple[str, str]]] = None) -> str:
     """Generate a beautifully formatted PDF report"""
-    
+
+    # (title, body) sections handed over by the report compiler; when
+    # present, the generator reads the discussion body directly instead of
+    # re-scanning the assembled report text for markers
+    section_map = dict(sections) if sections else {}
+    discussion_text = section_map.get("Collaborative Team Discussion")
+
     pdf = BeautifulFinancialPDF()
     
     # === COVER PAGE ===
@@ -408,10 +376,7 @@ def generate_beautiful_pdf_report(analysis_content: str, data_context: str, outp
     
     for num, title, page in toc_items:
         pdf.set_x(20)
-        if pdf.custom_font:
-            pdf.set_font("LiberationSans", "", 11)
-        else:
-            pdf.set_font("Arial", "", 11)
+        pdf.set_base_font("", 11)
         pdf.cell(150, 8, f"{num}. {title}", 0, 0)
         pdf.cell(20, 8, page, 0, 1, 'R')
     
@@ -485,17 +450,13 @@ def generate_beautiful_pdf_report(analysis_content: str, data_context: str, outp
     pdf.section_heading("Summary", level=2)
     pdf.body_text(f"Files processed: {files_count}. Combined data shape: {rows} rows × {cols} columns.")
 
-    # Compact numerical summary
+    # Compact numerical summary - reuses the numeric_df selected above
     try:
-        if dataframe is not None:
-            numeric_df = dataframe.select_dtypes(include=['number'])
-        else:
-            numeric_df = pd.DataFrame()  # empty fallback
         if not numeric_df.empty:
             pdf.section_heading("Key Financial Indicators", level=2)
 
             headers = ["Metric", "Mean", "Std", "Min", "25%", "50%", "75%", "Max"]
-            pdf.set_font(pdf.base_font if hasattr(pdf, 'base_font') else "Arial", "B", 11)
+            pdf.set_base_font("B", 11)
             pdf.set_text_color(0)
             col_widths = [45, 25, 25, 25, 25, 25, 25, 25]
 
@@ -503,8 +464,11 @@ def generate_beautiful_pdf_report(analysis_content: str, data_context: str, outp
                 pdf.cell(col_widths[i], 7, h, border=1, align="C")
             pdf.ln()
 
-            numeric_summary = numeric_df.describe().T.round(2).head(6)
-            pdf.set_font(pdf.base_font if hasattr(pdf, 'base_font') else "Arial", "", 10)
+            # Only the first 6 columns make it into the table, so restrict
+            # the frame before describing instead of describing everything
+            # and discarding most of it afterwards
+            numeric_summary = numeric_df.iloc[:, :6].describe().T.round(2)
+            pdf.set_base_font("", 10)
             pdf.set_text_color(40)
 
             for metric, row in numeric_summary.iterrows():
@@ -522,7 +486,12 @@ def generate_beautiful_pdf_report(analysis_content: str, data_context: str, outp
     pdf.section_heading("DataAnalyst's Findings", level=2)
     
     # Parse analysis content to extract DataAnalyst section
-    data_analyst_section = extract_section(analysis_content, "Data Analysis", "Risk Assessment")
+    # Search only the discussion body when the compiler handed it over;
+    # scanning the full report also matched its methodology/data-context text
+    data_analyst_section = extract_section(
+        discussion_text if discussion_text is not None else analysis_content,
+        "Data Analysis", "Risk Assessment"
+    )
     
     if data_analyst_section:
         pdf.body_text(data_analyst_section)
@@ -654,19 +623,35 @@ def generate_beautiful_pdf_report(analysis_content: str, data_context: str, outp
     
     pdf.ln(5)
     
-    # Clean and format the analysis content
-    clean_analysis = strip_markdown(analysis_content)
-    
-    # Split into manageable paragraphs
-    paragraphs = clean_analysis.split('\n\n')
-    
-    for para in paragraphs:
-        if para.strip():
-            # Check if it's a heading
-            if para.strip().endswith(':') or para.strip().isupper():
-                pdf.section_heading(para.strip(), level=3)
-            else:
-                pdf.body_text(para.strip())
+    # Clean and format the analysis content; the compiler's discussion
+    # section is already markdown-stripped, so use it as-is when available
+    # rather than re-stripping (and re-walking) the whole report
+    if discussion_text is not None:
+        clean_analysis = discussion_text
+    else:
+        clean_analysis = strip_markdown(analysis_content)
+    
+    # Render runs of consecutive body paragraphs with a single multi_cell
+    # call each; every multi_cell invocation re-measures and wraps text, so
+    # batching cuts the layout passes to one per run
+    pending_body: List[str] = []
+
+    def _flush_body():
+        if pending_body:
+            pdf.body_text("\n\n".join(pending_body))
+            pending_body.clear()
+
+    for para in clean_analysis.split('\n\n'):
+        para = para.strip()
+        if not para:
+            continue
+        # Check if it's a heading
+        if para.endswith(':') or para.isupper():
+            _flush_body()
+            pdf.section_heading(para, level=3)
+        else:
+            pending_body.append(para)
+    _flush_body()
     
     # === DATA OVERVIEW ===
     pdf.add_page()
@@ -741,20 +726,14 @@ def generate_beautiful_pdf_report(analysis_content: str, data_context: str, outp
     
     pdf.ln(60)
     
-    if pdf.custom_font:
-        pdf.set_font("LiberationSans", "B", 18)
-    else:
-        pdf.set_font("Arial", "B", 18)
+    pdf.set_base_font("B", 18)
     
     pdf.set_text_color(41, 98, 255)
     pdf.multi_cell(0, 10, "End of Report", 0, 'C')
     
     pdf.ln(10)
     
-    if pdf.custom_font:
-        pdf.set_font("LiberationSans", "", 11)
-    else:
-        pdf.set_font("Arial", "", 11)
+    pdf.set_base_font("", 11)
     
     pdf.set_text_color(100, 100, 100)
     closing_text = f"""
@@ -778,59 +757,71 @@ def extract_section(text: str, start_marker: str, end_marker: str | None = None)
     """Extract a section from text between markers"""
     if not text:
         return ""
-    
-    start_idx = text.lower().find(start_marker.lower())
+
+    # Lowercase the text once; both marker searches scan the same copy
+    lowered = text.lower()
+
+    start_idx = lowered.find(start_marker.lower())
     if start_idx == -1:
         return ""
-    
+
     if end_marker:
-        end_idx = text.lower().find(end_marker.lower(), start_idx + len(start_marker))
+        end_idx = lowered.find(end_marker.lower(), start_idx + len(start_marker))
         if end_idx != -1:
             return text[start_idx:end_idx].strip()
-    
+
     return text[start_idx:].strip()
 
 
-def strip_markdown(text: str) -> str:
-    """Remove markdown formatting for cleaner PDF output"""
-    if text is None:
-        return ""
-    if not isinstance(text, str):
-        return str(text)
-    
-    text = str(text)
+# Markdown-stripping substitutions, compiled once at import instead of
+# recompiling seven patterns on every call
+_MARKDOWN_SUBS = [
     # Remove bold
-    text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
+    (re.compile(r"\*\*(.*?)\*\*"), r"\1"),
     # Remove italic
-    text = re.sub(r"\*(.*?)\*", r"\1", text)
+    (re.compile(r"\*(.*?)\*"), r"\1"),
     # Remove headers but keep the text
-    text = re.sub(r"#{1,6}\s*", "", text)
+    (re.compile(r"#{1,6}\s*"), ""),
     # Remove bullet points but keep text
-    text = re.sub(r"^[-•*]\s*", "", text, flags=re.M)
+    (re.compile(r"^[-•*]\s*", re.M), ""),
     # Remove code blocks
-    text = re.sub(r"`([^`]*)`", r"\1", text)
+    (re.compile(r"`([^`]*)`"), r"\1"),
     # Remove links but keep text
-    text = re.sub(r"\[(.*?)\]\(.*?\)", r"\1", text)
+    (re.compile(r"\[(.*?)\]\(.*?\)"), r"\1"),
     # Clean up emojis
-    text = re.sub(r"[🔹→✓⚠️💰💸🏦🎓💵📈📊]", "", text)
-    
+    (re.compile(r"[🔹→✓⚠️💰💸🏦🎓💵📈📊]"), ""),
+]
+
+
+def strip_markdown(text: str) -> str:
+    """Remove markdown formatting for cleaner PDF output"""
+    if text is None:
+        return ""
+    if not isinstance(text, str):
+        return str(text)
+
+    for pattern, replacement in _MARKDOWN_SUBS:
+        text = pattern.sub(replacement, text)
+
     return text.strip()
 
 def generate_pdf_report(
     text: str,
     output_path: str,
     dataframe: Optional[pd.DataFrame] = None,
-    files_count: int = 0
+    files_count: int = 0,
+    sections: Optional[List[Tuple[str, str]]] = None
 ) -> str:
     """Simple PDF generator - use generate_beautiful_pdf_report instead for better formatting"""
-    
+
     # Just call the beautiful version with empty data context
     return generate_beautiful_pdf_report(
         analysis_content=text,
         data_context="",
         output_path=output_path,
         dataframe=dataframe,
-        files_count=files_count
+        files_count=files_count,
+        sections=sections
     )
 
 class TrueCollaborativeFinancialPipeline:
@@ -862,65 +853,95 @@ class TrueCollaborativeFinancialPipeline:
         )
         
         self.conversation_log = []
-    
+
+    async def _cached_arun(self, agent, prompt: str) -> str:
+        """Run an agent (or team) prompt with the on-disk response cache.
+
+        Identical prompts - same files, same statistics - skip the LLM call
+        entirely and return the stored response text.
+        """
+        cached = get_cached_response(prompt)
+        if cached is not None:
+            print("  [cache hit - skipping LLM call]")
+            return cached
+
+        response = await agent.arun(prompt)
+        content = str(response.content) if hasattr(response, 'content') and response.content else str(response)
+        store_response(prompt, content)
+        return content
+
     def prepare_financial_data(self, file_paths: list[str]) -> Tuple[str, pd.DataFrame]:
         """Prepare financial data with enhanced summary"""
         print("\n[Preparing Data] Reading financial files...")
         
         dfs = []
         file_summaries = []
-        
-        for path in file_paths:
-            try:
-                df = read_file_to_df(path)
-                dfs.append(df)
-                
-                file_name = os.path.basename(path)
-                summary = f"\n### File: {file_name}\n"
-                summary += f"**Shape**: {df.shape[0]} rows × {df.shape[1]} columns\n"
-                
-                if 'content' in df.columns:
-                    # Text-based file
-                    summary += f"**Type**: Text document\n"
-                    summary += f"**Preview**: {df['content'].iloc[0][:300]}...\n"
+
+        # Files are read concurrently; summaries are still built in input order
+        for path, result in read_files_to_dfs(file_paths):
+            if isinstance(result, Exception):
+                print(f"  ✗ Error reading {path}: {result}")
+                continue
+
+            df = result
+            dfs.append(df)
+
+            file_name = os.path.basename(path)
+            summary = f"\n### File: {file_name}\n"
+            summary += f"**Shape**: {df.shape[0]} rows × {df.shape[1]} columns\n"
+
+            if 'content' in df.columns:
+                # Text-based file
+                summary += f"**Type**: Text document\n"
+                summary += f"**Preview**: {df['content'].iloc[0][:300]}...\n"
+            else:
+                # Structured data
+                summary += f"**Columns**: {', '.join(df.columns.tolist()[:10])}"
+                if len(df.columns) > 10:
+                    summary += f" ... ({len(df.columns)} total)\n"
                 else:
-                    # Structured data
-                    summary += f"**Columns**: {', '.join(df.columns.tolist()[:10])}"
-                    if len(df.columns) > 10:
-                        summary += f" ... ({len(df.columns)} total)\n"
-                    else:
-                        summary += "\n"
-                    
-                    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-                    if numeric_cols:
-                        summary += f"\n**Key Statistics**:\n"
-                        
-                        # Focus on most important columns
-                        key_columns = [col for col in numeric_cols if any(keyword in col.lower() 
-                                    for keyword in ['revenue', 'expenditure', 'debt', 'tax'])]
-                        
-                        if key_columns:
-                            stats_df = df[key_columns].describe()
-                            summary += stats_df.to_string() + "\n"
-                
-                file_summaries.append(summary)
-                print(f"  ✓ Processed: {file_name} ({len(df)} records)")
-                
-            except Exception as e:
-                print(f"  ✗ Error reading {path}: {e}")
-        
+                    summary += "\n"
+
+                numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+                if numeric_cols:
+                    summary += f"\n**Key Statistics**:\n"
+
+                    # Focus on most important columns
+                    key_columns = [col for col in numeric_cols if any(keyword in col.lower()
+                                for keyword in ['revenue', 'expenditure', 'debt', 'tax'])]
+
+                    if key_columns:
+                        summary += fast_describe(df[key_columns]) + "\n"
+
+            file_summaries.append(summary)
+            print(f"  ✓ Processed: {file_name} ({len(df)} records)")
+
         if not dfs:
             raise ValueError("No data files were successfully loaded")
         
-        combined_df = pd.concat(dfs, ignore_index=True, sort=False)
-        
-        # Calculate pre-analysis metrics to help agents
+        # Skip the concat (and its copy of every block) in the common
+        # single-file case
+        if len(dfs) == 1:
+            combined_df = dfs[0]
+        else:
+            combined_df = pd.concat(dfs, ignore_index=True, sort=False)
+        
+        # Calculate pre-analysis metrics to help agents - one aggregation
+        # pass over the metric columns instead of repeated per-column calls
+        metric_cols = [col for col in (
+            'Totals.Revenue',
+            'Totals.Expenditure',
+            'Totals. Debt at end of fiscal year',
+            'Details.Education.Education Total',
+        ) if col in combined_df.columns]
+        stats = combined_df[metric_cols].agg(['mean', 'std', 'min', 'max']) if metric_cols else None
+
         key_metrics = ""
         if 'Totals.Revenue' in combined_df.columns and 'Totals.Expenditure' in combined_df.columns:
-            avg_revenue = combined_df['Totals.Revenue'].mean()
-            std_revenue = combined_df['Totals.Revenue'].std()
-            avg_expenditure = combined_df['Totals.Expenditure'].mean()
-            
+            avg_revenue = stats.at['mean', 'Totals.Revenue']
+            std_revenue = stats.at['std', 'Totals.Revenue']
+            avg_expenditure = stats.at['mean', 'Totals.Expenditure']
+
             surplus_deficit = avg_revenue - avg_expenditure
             deficit_pct = (surplus_deficit / avg_revenue * 100)
             volatility = (std_revenue / avg_revenue * 100)
@@ -931,7 +952,7 @@ class TrueCollaborativeFinancialPipeline:
         **Revenue Analysis**:
         - Average Revenue: ${avg_revenue:,.0f} (thousands)
         - Standard Deviation: ${std_revenue:,.0f} (volatility: {volatility:.1f}%)
-        - Range: ${combined_df['Totals.Revenue'].min():,.0f} to ${combined_df['Totals.Revenue'].max():,.0f}
+        - Range: ${stats.at['min', 'Totals.Revenue']:,.0f} to ${stats.at['max', 'Totals.Revenue']:,.0f}
 
         **Expenditure Analysis**:
         - Average Expenditure: ${avg_expenditure:,.0f} (thousands)
@@ -940,8 +961,8 @@ class TrueCollaborativeFinancialPipeline:
         """
             
             if 'Totals. Debt at end of fiscal year' in combined_df.columns:
-                avg_debt = combined_df['Totals. Debt at end of fiscal year'].mean()
-                max_debt = combined_df['Totals. Debt at end of fiscal year'].max()
+                avg_debt = stats.at['mean', 'Totals. Debt at end of fiscal year']
+                max_debt = stats.at['max', 'Totals. Debt at end of fiscal year']
                 debt_to_revenue = avg_debt / avg_revenue
                 
                 key_metrics += f"""
@@ -953,9 +974,9 @@ class TrueCollaborativeFinancialPipeline:
         """
             
             if 'Details.Education.Education Total' in combined_df.columns:
-                avg_education = combined_df['Details.Education.Education Total'].mean()
+                avg_education = stats.at['mean', 'Details.Education.Education Total']
                 education_pct = (avg_education / avg_expenditure * 100)
-                
+
                 key_metrics += f"""
         **Education Spending**:
         - Average Education Budget: ${avg_education:,.0f} (thousands)
@@ -1023,14 +1044,17 @@ class TrueCollaborativeFinancialPipeline:
         key_financial_cols = key_financial_cols[:8]
         
         stats_text = "\n**Key Financial Statistics**:\n\n"
-        
+
+        # One vectorized pass over the selected columns instead of four
+        # separate reductions per column inside the loop
+        stats = df[key_financial_cols].agg(['mean', 'std', 'min', 'max'])
+
         for col in key_financial_cols:
-            # Get statistics
-            mean_val = df[col].mean()
-            std_val = df[col].std()
-            min_val = df[col].min()
-            max_val = df[col].max()
-            
+            mean_val = stats.at['mean', col]
+            std_val = stats.at['std', col]
+            min_val = stats.at['min', col]
+            max_val = stats.at['max', col]
+
             # Format column name (shorten if too long)
             col_display = col.replace('Totals.', '').replace('Details.', '')
             if len(col_display) > 40:
@@ -1167,7 +1191,11 @@ class TrueCollaborativeFinancialPipeline:
     
     def execute(self, file_paths: List[str], report_path: str = "collaborative_report.pdf") -> str:
         """Execute true collaborative multi-agent analysis"""
-        
+        return asyncio.run(self._execute_async(file_paths, report_path))
+
+    async def _execute_async(self, file_paths: List[str], report_path: str) -> str:
+        """Async implementation of execute - overlaps LLM waits with local work"""
+
         print("\n" + "="*80)
         print("TRUE COLLABORATIVE MULTI-AGENT FINANCIAL ANALYSIS")
         print("="*80)
@@ -1175,8 +1203,8 @@ class TrueCollaborativeFinancialPipeline:
         print(f"Team: {len(self.team.members)} specialized agents")
         print("="*80)
         
-        # Prepare data
-        financial_data, combined_df = self.prepare_financial_data(file_paths)
+        # Prepare data off the event loop - file reads are blocking I/O
+        financial_data, combined_df = await asyncio.to_thread(self.prepare_financial_data, file_paths)
 
         # Create collaborative analysis prompt
         collaborative_prompt = f"""
@@ -1239,14 +1267,7 @@ class TrueCollaborativeFinancialPipeline:
         
         try:
             # Run the collaborative team discussion
-            response = self.team.run(collaborative_prompt)
-            
-            # Extract the collaborative discussion
-            discussion_content = ""
-            if hasattr(response, 'content') and response.content is not None:
-                discussion_content = str(response.content)
-            else:
-                discussion_content = str(response) if response is not None else ""
+            discussion_content = await self._cached_arun(self.team, collaborative_prompt)
             
             # Log the conversation
             self.conversation_log.append({
@@ -1261,17 +1282,18 @@ class TrueCollaborativeFinancialPipeline:
             
             if len(discussion_content) < 500:
                 print("\n⚠️  WARNING: Discussion seems too brief. Enhancing with follow-up...")
-                discussion_content = self._enhance_collaboration(financial_data, discussion_content)
+                discussion_content = await self._enhance_collaboration(financial_data, discussion_content)
             
             # Generate final report
             print("\n[Generating Final Report]...")
-            report_content = self._compile_final_report(financial_data, discussion_content)
-            
+            report_content, report_sections = self._compile_final_report(financial_data, discussion_content)
+
             output = generate_pdf_report(
                 report_content,
                 report_path,
                 dataframe=combined_df,
-                files_count=len(file_paths)
+                files_count=len(file_paths),
+                sections=report_sections
             )
 
             
@@ -1290,9 +1312,9 @@ class TrueCollaborativeFinancialPipeline:
             
             # Fallback to structured approach
             print("\n[Fallback] Using structured agent-by-agent approach...")
-            return self._structured_fallback(file_paths, financial_data, report_path)
-    
-    def _enhance_collaboration(self, financial_data: str, initial_discussion: str) -> str:
+            return await self._structured_fallback(file_paths, financial_data, combined_df, report_path)
+
+    async def _enhance_collaboration(self, financial_data: str, initial_discussion: str) -> str:
         """Enhance collaboration with follow-up round"""
         
         print("[Enhancement Round] Prompting for deeper analysis...")
@@ -1321,13 +1343,7 @@ class TrueCollaborativeFinancialPipeline:
     ReportCompiler: Please facilitate this deeper discussion and compile the enhanced insights.
     """
             
-        followup_response = self.team.run(followup_prompt)
-        
-        enhanced_content = ""
-        if hasattr(followup_response, 'content') and followup_response.content is not None:
-            enhanced_content = str(followup_response.content)
-        else:
-            enhanced_content = str(followup_response) if followup_response is not None else ""
+        enhanced_content = await self._cached_arun(self.team, followup_prompt)
         
         self.conversation_log.append({
             'prompt': followup_prompt,
@@ -1348,17 +1364,40 @@ class TrueCollaborativeFinancialPipeline:
         
         return full_discussion
     
-    def _compile_final_report(self, financial_data: str, discussion: str) -> str:
-        """Compile the collaborative discussion into a structured report"""
-        
+    def _compile_final_report(self, financial_data: str, discussion: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """Compile the collaborative discussion into a structured report.
+
+        Returns the assembled report text plus the (title, body) sections it
+        was built from, so the PDF generator can consume the sections
+        directly instead of re-parsing the concatenated text.
+        """
+
         clean_discussion = self._strip_markdown(discussion)
-        
+
+        executive_summary = "This report was generated through true multi-agent collaboration where specialized AI agents communicated with each other, shared insights, and built upon each other's findings. The DataAnalyst identified key metrics, the RiskEvaluator assessed risks based on those metrics, and the StrategyAdvisor synthesized both perspectives into actionable recommendations."
+
+        methodology = """This analysis was conducted through genuine agent-to-agent collaboration:
+
+1. **DataAnalyst** examined the financial data and shared specific metrics with the team
+2. **RiskEvaluator** responded to DataAnalyst's findings and assessed risk levels
+3. **StrategyAdvisor** synthesized insights from both agents into strategic recommendations
+4. **ReportCompiler** facilitated the discussion and compiled this final report
+
+The agents communicated throughout the process, referencing each other's findings and asking clarifying questions. This represents true multi-agent intelligence where the collective output exceeds individual agent capabilities."""
+
+        sections = [
+            ("Executive Summary", executive_summary),
+            ("Collaborative Team Discussion", clean_discussion),
+            ("Methodology", methodology),
+            ("Data Context", financial_data),
+        ]
+
         report = f"""COLLABORATIVE FINANCIAL ANALYSIS REPORT
 {'='*80}
 
 EXECUTIVE SUMMARY:
 
-This report was generated through true multi-agent collaboration where specialized AI agents communicated with each other, shared insights, and built upon each other's findings. The DataAnalyst identified key metrics, the RiskEvaluator assessed risks based on those metrics, and the StrategyAdvisor synthesized both perspectives into actionable recommendations.
+{executive_summary}
 
 {'='*80}
 
@@ -1370,14 +1409,7 @@ COLLABORATIVE TEAM DISCUSSION:
 
 METHODOLOGY:
 
-This analysis was conducted through genuine agent-to-agent collaboration:
-
-1. **DataAnalyst** examined the financial data and shared specific metrics with the team
-2. **RiskEvaluator** responded to DataAnalyst's findings and assessed risk levels
-3. **StrategyAdvisor** synthesized insights from both agents into strategic recommendations
-4. **ReportCompiler** facilitated the discussion and compiled this final report
-
-The agents communicated throughout the process, referencing each other's findings and asking clarifying questions. This represents true multi-agent intelligence where the collective output exceeds individual agent capabilities.
+{methodology}
 
 {'='*80}
 
@@ -1392,9 +1424,9 @@ Framework: Agno Multi-Agent Framework
 Analysis Type: Collaborative Multi-Agent Discussion
 Total Collaboration Rounds: {len(self.conversation_log)}
 """
-        return report
+        return report, sections
     
-    def _structured_fallback(self, file_paths: List[str], financial_data: str, report_path: str) -> str:
+    async def _structured_fallback(self, file_paths: List[str], financial_data: str, combined_df: pd.DataFrame, report_path: str) -> str:
         """Fallback to structured sequential execution if team collaboration fails"""
             
         print("\n[Structured Fallback Mode]")
@@ -1415,8 +1447,7 @@ Total Collaboration Rounds: {len(self.conversation_log)}
         Provide specific numbers that RiskEvaluator and StrategyAdvisor can use.
         """
                 
-        data_response = self.data_analyst.run(data_prompt)
-        data_findings = str(data_response.content) if hasattr(data_response, 'content') and data_response.content else str(data_response)
+        data_findings = await self._cached_arun(self.data_analyst, data_prompt)
         print(f"✓ Complete ({len(data_findings)} chars)\n")
         
         # Phase 2: Risk Evaluator
@@ -1442,8 +1473,7 @@ Total Collaboration Rounds: {len(self.conversation_log)}
         For each risk, explain what could go wrong and what should be monitored.
         """
             
-        risk_response = self.risk_evaluator.run(risk_prompt)
-        risk_findings = str(risk_response.content) if hasattr(risk_response, 'content') and risk_response.content else str(risk_response)
+        risk_findings = await self._cached_arun(self.risk_evaluator, risk_prompt)
         print(f"✓ Complete ({len(risk_findings)} chars)\n")
         
         # Phase 3: Strategy Advisor
@@ -1473,8 +1503,7 @@ Total Collaboration Rounds: {len(self.conversation_log)}
         Timeline: [schedule]
         """
             
-        strategy_response = self.strategy_advisor.run(strategy_prompt)
-        strategy_findings = str(strategy_response.content) if hasattr(strategy_response, 'content') and strategy_response.content else str(strategy_response)
+        strategy_findings = await self._cached_arun(self.strategy_advisor, strategy_prompt)
         print(f"✓ Complete ({len(strategy_findings)} chars)\n")
     
         # Phase 4: Report Compiler
@@ -1501,10 +1530,8 @@ Total Collaboration Rounds: {len(self.conversation_log)}
     Show how insights from all team members integrate into a coherent strategy.
     """
         
-        compilation_response = self.report_compiler.run(compilation_prompt)
-        compiled_report = str(compilation_response.content) if hasattr(compilation_response, 'content') and compilation_response.content else str(compilation_response)
+        compiled_report = await self._cached_arun(self.report_compiler, compilation_prompt)
         print(f"✓ Complete ({len(compiled_report)} chars)\n")
-        financial_data, combined_df = self.prepare_financial_data(file_paths)
         
         # Store conversation
         self.conversation_log.extend([
@@ -1537,12 +1564,13 @@ Total Collaboration Rounds: {len(self.conversation_log)}
 {compiled_report}
 """
         
-        report_content = self._compile_final_report(financial_data, full_discussion)
+        report_content, report_sections = self._compile_final_report(financial_data, full_discussion)
         output = generate_pdf_report(
             report_content,
             report_path,
             dataframe=combined_df,
-            files_count=len(file_paths)
+            files_count=len(file_paths),
+            sections=report_sections
         )
 
         
@@ -1553,28 +1581,7 @@ Total Collaboration Rounds: {len(self.conversation_log)}
     
     def _strip_markdown(self, text: str) -> str:
         """Remove markdown formatting for cleaner PDF output"""
-        if text is None:
-            return ""
-        if not isinstance(text, str):
-            return str(text)
-        
-        text = str(text)
-        # Remove bold
-        text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
-        # Remove italic
-        text = re.sub(r"\*(.*?)\*", r"\1", text)
-        # Remove headers but keep the text
-        text = re.sub(r"#{1,6}\s*", "", text)
-        # Remove bullet points but keep text
-        text = re.sub(r"^[-•*]\s*", "", text, flags=re.M)
-        # Remove code blocks
-        text = re.sub(r"`([^`]*)`", r"\1", text)
-        # Remove links but keep text
-        text = re.sub(r"\[([^\]]+)\]\(https?://[^\)]+\)", r"\1", text)
-        # Clean up emojis
-        text = re.sub(r"[🔹→✓⚠️]", "", text)
-        
-        return text.strip()
+        return strip_markdown(text)
     
     def save_conversation_log(self, output_path: str = "conversation_log.txt"):
         """Save the full agent conversation for debugging/review"""